@@ -1,30 +1,144 @@
 """CRFCF Parser - Parses CRFCF documents into AST per PEG grammar"""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
-from enum import Enum
+from typing import ClassVar, List, Optional
+from enum import IntEnum
 import re
 
 
-class NodeType(Enum):
+# Precompiled line patterns (compiled once at import, not per line).
+# Main ('1.  Title:') and sub ('1.1 Title:') headers share one
+# alternation so a header line costs a single engine entry.
+_RE_HEADER = re.compile(
+    r'^(?:(?P<main>\d+)\.\s\s|(?P<sub>\d+\.\d+)\s)(?P<title>.+):$'
+)
+_RE_DISCLAIMER = re.compile(r'^\d+\.\s+\w+:')
+_RE_OLIST = re.compile(r'^(\s*)([A-Za-z0-9]+)\.\s+(.+)$')
+
+# Leading characters shared by both document marker lines
+_MARKER_PREFIX = '|<---'
+
+# Token/line classifications returned by _classify
+_PARA = 0
+_MAIN_HDR = 1
+_SUB_HDR = 2
+_ULIST = 3
+_OLIST = 4
+_END_MARK = 5
+_BLANK = 6
+
+
+def _classify(line: str, stripped: str) -> int:
+    """Classify a line with branch-and-compare character tests.
+
+    Takes the line and its leading-space-stripped form (computed once
+    per line by the lexer). Pure indexing and ordinal comparisons --
+    no regex and no str predicate calls -- so each line costs a
+    handful of interpreter ops and the whole routine stays trivially
+    compilable.
+    """
+    if not line:
+        return _BLANK
+    if line[:5] == _MARKER_PREFIX:
+        return _END_MARK
+    if stripped[:2] == '- ':
+        return _ULIST
+
+    n = len(line)
+    if '0' <= line[0] <= '9' and line[n - 1] == ':':
+        i = 1
+        while i < n and '0' <= line[i] <= '9':
+            i += 1
+        if (i + 4 < n and line[i] == '.'
+                and line[i + 1] == ' ' and line[i + 2] == ' '):
+            return _MAIN_HDR
+        if i + 1 < n and line[i] == '.' and '0' <= line[i + 1] <= '9':
+            j = i + 2
+            while j < n and '0' <= line[j] <= '9':
+                j += 1
+            if j + 2 < n and line[j] == ' ':
+                return _SUB_HDR
+
+    # Ordered item prefix: alphanumeric run, '.', whitespace (the
+    # full item pattern is verified at lex time)
+    k = 0
+    m = len(stripped)
+    while k < m and (stripped[k] == ' ' or stripped[k] == '\t'):
+        k += 1
+    run = k
+    while k < m and ('0' <= stripped[k] <= '9'
+                     or 'a' <= stripped[k] <= 'z'
+                     or 'A' <= stripped[k] <= 'Z'):
+        k += 1
+    if (k > run and k + 1 < m and stripped[k] == '.'
+            and (stripped[k + 1] == ' ' or stripped[k + 1] == '\t')):
+        return _OLIST
+
+    return _PARA
+
+
+def _indent_and_strip(line: str) -> tuple:
+    """Walk leading spaces once; return (space count, stripped line)."""
+    k = 0
+    n = len(line)
+    while k < n and line[k] == ' ':
+        k += 1
+    return k, line[k:]
+
+
+def _token_text(token: tuple) -> str:
+    """Reconstruct the source line carried by a token."""
+    kind = token[0]
+    payload = token[2]
+    if kind == _MAIN_HDR:
+        return f"{payload[0]}.  {payload[1]}:"
+    if kind == _SUB_HDR:
+        return f"{payload[0]} {payload[1]}:"
+    if kind == _ULIST:
+        return ' ' * token[1] + payload
+    if kind == _OLIST:
+        return ' ' * token[1] + payload[2]
+    return payload
+
+
+class NodeType(IntEnum):
     """AST node types for CRFCF document elements"""
-    DOCUMENT = "document"
-    BEGIN_MARKER = "begin_marker"
-    END_MARKER = "end_marker"
-    DISCLAIMER = "disclaimer"
-    MAIN_SECTION = "main_section"
-    SUBSECTION = "subsection"
-    SPECIFIC_SECTION = "specific_section"
-    SECTION_HEADER = "section_header"
-    SECTION_BODY = "section_body"
-    PARAGRAPH = "paragraph"
-    ORDERED_LIST = "ordered_list"
-    UNORDERED_LIST = "unordered_list"
-    LIST_ITEM = "list_item"
-    FOOTER_NOTES = "footer_notes"
-
-
-@dataclass
+    DOCUMENT = 0
+    BEGIN_MARKER = 1
+    END_MARKER = 2
+    DISCLAIMER = 3
+    MAIN_SECTION = 4
+    SUBSECTION = 5
+    SPECIFIC_SECTION = 6
+    SECTION_HEADER = 7
+    SECTION_BODY = 8
+    PARAGRAPH = 9
+    ORDERED_LIST = 10
+    UNORDERED_LIST = 11
+    LIST_ITEM = 12
+    FOOTER_NOTES = 13
+
+
+# Exported type names, indexed by NodeType value
+_TYPE_NAME = (
+    "document",
+    "begin_marker",
+    "end_marker",
+    "disclaimer",
+    "main_section",
+    "subsection",
+    "specific_section",
+    "section_header",
+    "section_body",
+    "paragraph",
+    "ordered_list",
+    "unordered_list",
+    "list_item",
+    "footer_notes",
+)
+
+
+@dataclass(slots=True)
 class ASTNode:
     """AST node with type, value, children, and metadata"""
     node_type: NodeType
@@ -33,34 +147,105 @@ class ASTNode:
     line: Optional[int] = None
     level: Optional[int] = None
     metadata: dict = field(default_factory=dict)
+    canonical_hash: Optional[int] = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    # Maps canonical hash -> serialized dict, shared across instances so
+    # identical subtrees (boilerplate disclaimers, footers) serialize once
+    # per batch. Callers must treat returned dicts as read-only.
+    _dict_cache: ClassVar[dict] = {}
+
+    def structural_hash(self) -> int:
+        """Hash of this subtree's full serialized content, cached per node"""
+        h = self.canonical_hash
+        if h is not None:
+            return h
+        # Collect the subtree in pre-order, then hash in reverse so every
+        # child hash exists before its parent's is computed
+        order = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.canonical_hash is None:
+                order.append(node)
+                stack.extend(node.children)
+        for node in reversed(order):
+            node.canonical_hash = hash((
+                node.node_type,
+                node.value,
+                node.line,
+                node.level,
+                tuple(node.metadata.items()) if node.metadata else None,
+                tuple(c.canonical_hash for c in node.children),
+            ))
+        return self.canonical_hash
 
     def to_dict(self) -> dict:
-        """Convert to dictionary"""
-        result = {"type": self.node_type.value}
-        if self.value is not None:
-            result["value"] = self.value
-        if self.children:
-            result["children"] = [
-                child.to_dict() for child in self.children
-            ]
-        if self.line is not None:
-            result["line"] = self.line
-        if self.level is not None:
-            result["level"] = self.level
-        if self.metadata:
-            result["metadata"] = self.metadata
+        """Convert to dictionary (iteratively, via an explicit stack)"""
+        cache = ASTNode._dict_cache
+        key = self.structural_hash()
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = {}
+        pending = [(key, result)]
+        stack = [(self, result)]
+        while stack:
+            node, out = stack.pop()
+            out["type"] = _TYPE_NAME[node.node_type]
+            if node.value is not None:
+                out["value"] = node.value
+            children = node.children
+            if children:
+                # Pre-place one dict per child; each gets filled when
+                # its (node, dict) pair is popped, unless a prior call
+                # already serialized an identical subtree
+                child_dicts = []
+                for child in children:
+                    child_dict = cache.get(child.canonical_hash)
+                    if child_dict is None:
+                        child_dict = {}
+                        stack.append((child, child_dict))
+                        if child.children:
+                            pending.append(
+                                (child.canonical_hash, child_dict)
+                            )
+                    child_dicts.append(child_dict)
+                out["children"] = child_dicts
+            if node.line is not None:
+                out["line"] = node.line
+            if node.level is not None:
+                out["level"] = node.level
+            if node.metadata:
+                out["metadata"] = node.metadata
+
+        # Publish only once the whole tree is filled in; caching just
+        # branching nodes (plus the root) caps memory on large corpora
+        for subtree_hash, subtree_dict in pending:
+            cache[subtree_hash] = subtree_dict
         return result
 
 
+# Shared node for sections with no body content. Safe to share because
+# children lists are never mutated after construction.
+_EMPTY_BODY = ASTNode(NodeType.SECTION_BODY)
+
+
 class CRFCFParser:
     """Parses CRFCF files into AST. Assumes 4-space indents."""
 
     INDENT_SIZE = 4
 
+    _MARKER = "<" + ("-" * 31) + ">"
+    _BEGIN_LINE = f"|{_MARKER}[ BEGIN-CRFCF ]{_MARKER}|"
+    _END_LINE = f"|{_MARKER}[ ENDED-CRFCF ]{_MARKER}|"
+
     def __init__(self) -> None:
-        self.lines: List[str] = []
+        self.tokens: List[tuple] = []
         self.position: int = 0
-        self.current_line: int = 1
+        self._content: str = ''
 
     def parse_file(self, filepath: str) -> ASTNode:
         """Parse CRFCF file into AST. Raises FileNotFoundError."""
@@ -68,12 +253,12 @@ class CRFCFParser:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Split into lines (preserve empty lines)
-        self.lines = content.splitlines()
+        # Lex once: each line gets exactly one classification up front
+        self._content = content
+        self.tokens = self._tokenize(content)
 
         # Reset parser state
         self.position = 0
-        self.current_line = 1
 
         begin_marker = self._parse_begin_marker()
         disclaimer = self._parse_disclaimer()
@@ -81,77 +266,147 @@ class CRFCFParser:
         footer_notes = self._parse_footer_notes()
         end_marker = self._parse_end_marker()
 
-        children = [begin_marker, disclaimer] + sections
+        children = [begin_marker, disclaimer]
+        children.extend(sections)
         if footer_notes:
             children.append(footer_notes)
         children.append(end_marker)
 
         return ASTNode(NodeType.DOCUMENT, children=children)
 
-    def _peek_line(self, offset: int = 0) -> Optional[str]:
-        """Return line at position+offset without consuming."""
+    def _tokenize(self, content: str) -> List[tuple]:
+        """Lex content into (kind, spaces, payload, offset) tokens.
+
+        Walks the buffer newline by newline instead of materializing a
+        separate line list (universal-newline decoding has already
+        normalized line endings to LF). Leading spaces are walked
+        exactly once per line. Header payloads carry the captured
+        (number, title) groups, ordered item payloads (number,
+        content, stripped line) and unordered item payloads the
+        stripped line, so parse methods never re-strip or re-match;
+        other payloads are the raw line. The offset is the line's
+        position in the source buffer; it both yields line numbers
+        (tokens are one per line, so the token index does) and lets
+        multi-line values be sliced out in one piece.
+        """
+        tokens = []
+        append = tokens.append
+        find = content.find
+        indent_and_strip = _indent_and_strip
+        classify = _classify
+        header_match = _RE_HEADER.match
+        olist_match = _RE_OLIST.match
+        size = len(content)
+        pos = 0
+        while pos < size:
+            line_start = pos
+            end = find('\n', pos)
+            if end == -1:
+                line = content[pos:]
+                pos = size
+            else:
+                line = content[pos:end]
+                pos = end + 1
+            spaces, stripped = indent_and_strip(line)
+            kind = classify(line, stripped)
+            if kind == _MAIN_HDR or kind == _SUB_HDR:
+                match = header_match(line)
+                number = match.group('main') or match.group('sub')
+                append(
+                    (kind, 0, (number, match.group('title')), line_start)
+                )
+                continue
+            if kind == _OLIST:
+                match = olist_match(stripped)
+                if match is None:
+                    # Prefix looks like an ordered item but there is
+                    # no content after it; treat as plain text
+                    append((_PARA, spaces, line, line_start))
+                    continue
+                append((
+                    kind, spaces,
+                    (match.group(2), match.group(3), stripped), line_start
+                ))
+                continue
+            if kind == _ULIST:
+                append((kind, spaces, stripped, line_start))
+                continue
+            append((kind, spaces, line, line_start))
+        return tokens
+
+    def _slice_value(self, first: int, last: int) -> str:
+        """Slice the source covering tokens[first:last], stripped."""
+        if first >= last:
+            return ''
+        tokens = self.tokens
+        begin = tokens[first][3]
+        if last < len(tokens):
+            end = tokens[last][3] - 1
+        else:
+            end = len(self._content)
+        return self._content[begin:end].strip()
+
+    def _peek_token(self, offset: int = 0) -> Optional[tuple]:
+        """Return token at position+offset without consuming."""
         idx = self.position + offset
-        if idx < len(self.lines):
-            return self.lines[idx]
+        if idx < len(self.tokens):
+            return self.tokens[idx]
         return None
 
-    def _consume_line(self) -> Optional[str]:
-        """Return current line and advance position."""
-        if self.position < len(self.lines):
-            line = self.lines[self.position]
+    def _consume_token(self) -> Optional[tuple]:
+        """Return current token and advance position."""
+        if self.position < len(self.tokens):
+            token = self.tokens[self.position]
             self.position += 1
-            self.current_line += 1
-            return line
+            return token
         return None
 
-    def _get_indent_level(self, line: str) -> int:
-        """Calculate indent level (spaces / 4)."""
-        spaces = len(line) - len(line.lstrip(' '))
-        return spaces // self.INDENT_SIZE
-
     def _parse_begin_marker(self) -> ASTNode:
         """Parse BEGIN-CRFCF marker. Raises SyntaxError if invalid."""
-        line = self._consume_line()
-        marker = "<" + ("-" * 31) + ">"
-        tag = "[ BEGIN-CRFCF ]"
-        expected = f"|{marker}{tag}{marker}|"
-
-        if line != expected:
+        token = self._consume_token()
+        if token is None or token[2] != self._BEGIN_LINE:
             raise SyntaxError(
-                f"Invalid begin marker at line {self.current_line}"
+                f"Invalid begin marker at line {self.position + 1}"
             )
-        return ASTNode(NodeType.BEGIN_MARKER, line=self.current_line)
+        return ASTNode(NodeType.BEGIN_MARKER, line=self.position + 1)
 
     def _parse_end_marker(self) -> ASTNode:
         """Parse ENDED-CRFCF marker. Raises SyntaxError if invalid."""
-        line = self._consume_line()
-        marker = "<" + ("-" * 31) + ">"
-        tag = "[ ENDED-CRFCF ]"
-        expected = f"|{marker}{tag}{marker}|"
-
-        if line and line != expected:
+        token = self._consume_token()
+        if token is not None and token[2] and token[2] != self._END_LINE:
             raise SyntaxError(
-                f"Invalid end marker at line {self.current_line}"
+                f"Invalid end marker at line {self.position + 1}"
             )
-        return ASTNode(NodeType.END_MARKER, line=self.current_line)
+        return ASTNode(NodeType.END_MARKER, line=self.position + 1)
 
     def _parse_disclaimer(self) -> ASTNode:
         """Parse disclaimer text between begin marker and sections."""
-        while self._peek_line() == '':
-            self._consume_line()
+        while True:
+            token = self._peek_token()
+            if token is None or token[0] != _BLANK:
+                break
+            self._consume_token()
 
-        lines = []
-        start = self.current_line
+        first = self.position
+        start = first + 1
 
-        while self._peek_line() is not None:
-            line = self._peek_line()
-            if re.match(r'^\d+\.\s+\w+:', line):
+        while True:
+            token = self._peek_token()
+            if token is None:
                 break
-            if line == '' and self._peek_line(1) == '':
+            kind = token[0]
+            if kind == _MAIN_HDR or kind == _SUB_HDR:
                 break
-            lines.append(self._consume_line())
+            if (kind == _OLIST and token[1] == 0
+                    and _RE_DISCLAIMER.match(token[2][2])):
+                break
+            if kind == _BLANK:
+                following = self._peek_token(1)
+                if following is not None and following[0] == _BLANK:
+                    break
+            self._consume_token()
 
-        content = '\n'.join(lines).strip()
+        content = self._slice_value(first, self.position)
         return ASTNode(
             NodeType.DISCLAIMER,
             value=content,
@@ -159,279 +414,209 @@ class CRFCFParser:
         )
 
     def _parse_sections(self) -> List[ASTNode]:
-        """Parse all sections until end marker."""
+        """Parse all sections until end marker.
+
+        One loop frame dispatches every section header directly by
+        token kind; only the body parsers push additional frames.
+        """
         sections = []
 
-        while self._peek_line() is not None:
-            line = self._peek_line()
-            if line and line.startswith('|<---'):
+        while True:
+            token = self._peek_token()
+            if token is None or token[0] == _END_MARK:
                 break
-            if line == '':
-                self._consume_line()
+            kind = token[0]
+            if kind == _BLANK:
+                self._consume_token()
                 continue
 
-            section = self._parse_section()
-            if section:
-                sections.append(section)
-
-        return sections
-
-    def _parse_section(self) -> Optional[ASTNode]:
-        """Parse section by type: main, subsection, or specific."""
-        line = self._peek_line()
-        if not line:
-            return None
-
-        if re.match(r'^(\d+)\.\s\s(.+):$', line):
-            return self._parse_main_section()
-        if re.match(r'^(\d+\.\d+)\s(.+):$', line):
-            return self._parse_subsection()
-
-        stripped = line.lstrip()
-        if stripped.startswith('- ') and stripped[2:].endswith(':'):
-            return self._parse_specific_section()
-
-        return None
-
-    def _parse_main_section(self) -> ASTNode:
-        """Parse numbered main section (e.g., '1.  Title:')."""
-        header_line = self._consume_line()
-        start = self.current_line
-
-        match = re.match(r'^(\d+)\.\s\s(.+):$', header_line)
-        num = match.group(1)
-        title = match.group(2)
-
-        if self._peek_line() == '':
-            self._consume_line()
-
-        body = self._parse_section_body(level=1)
-
-        header = ASTNode(
-            NodeType.SECTION_HEADER,
-            value=f"{num}.  {title}",
-            metadata={"number": num, "title": title},
-            line=start
-        )
-
-        return ASTNode(
-            NodeType.MAIN_SECTION,
-            children=[header, body],
-            line=start
-        )
-
-    def _parse_subsection(self) -> ASTNode:
-        """Parse numbered subsection (e.g., '1.1 Title:')."""
-        header_line = self._consume_line()
-        start = self.current_line
-
-        match = re.match(r'^(\d+\.\d+)\s(.+):$', header_line)
-        num = match.group(1)
-        title = match.group(2)
-
-        if self._peek_line() == '':
-            self._consume_line()
-
-        body = self._parse_section_body(level=1)
-
-        header = ASTNode(
-            NodeType.SECTION_HEADER,
-            value=f"{num} {title}",
-            metadata={"number": num, "title": title},
-            line=start
-        )
-
-        return ASTNode(
-            NodeType.SUBSECTION,
-            children=[header, body],
-            line=start
-        )
-
-    def _parse_specific_section(self) -> ASTNode:
-        """Parse indented specific section (e.g., '    - Title:')."""
-        header_line = self._consume_line()
-        start = self.current_line
-        indent = self._get_indent_level(header_line)
+            if kind == _MAIN_HDR:
+                num, title = token[2]
+                node_type = NodeType.MAIN_SECTION
+                value = f"{num}.  {title}"
+                level = None
+            elif kind == _SUB_HDR:
+                num, title = token[2]
+                node_type = NodeType.SUBSECTION
+                value = f"{num} {title}"
+                level = None
+            elif kind == _ULIST and token[2].endswith(':'):
+                num = None
+                node_type = NodeType.SPECIFIC_SECTION
+                value = token[2].rstrip()[2:-1]
+                level = token[1] // self.INDENT_SIZE
+            else:
+                # Not a section header; leave the rest to footer notes
+                break
 
-        title = header_line.strip()[2:-1]
+            self._consume_token()
+            start = self.position + 1
 
-        if self._peek_line() == '':
-            self._consume_line()
+            following = self._peek_token()
+            if following is not None and following[0] == _BLANK:
+                self._consume_token()
 
-        body = self._parse_section_body(level=indent + 1)
+            body = self._parse_section_body(
+                level=1 if level is None else level + 1
+            )
 
-        header = ASTNode(
-            NodeType.SECTION_HEADER,
-            value=title,
-            level=indent,
-            line=start
-        )
+            header = ASTNode(
+                NodeType.SECTION_HEADER,
+                value=value,
+                metadata=(
+                    {"number": num, "title": title}
+                    if num is not None else {}
+                ),
+                level=level,
+                line=start
+            )
+            sections.append(ASTNode(
+                node_type,
+                children=[header, body],
+                level=level,
+                line=start
+            ))
 
-        return ASTNode(
-            NodeType.SPECIFIC_SECTION,
-            children=[header, body],
-            level=indent,
-            line=start
-        )
+        return sections
 
     def _parse_section_body(self, level: int) -> ASTNode:
-        """Parse section body: paragraphs, lists. Stops at headers."""
-        children = []
+        """Parse section body: paragraphs, lists. Stops at headers.
 
-        while self._peek_line() is not None:
-            line = self._peek_line()
-
-            if re.match(r'^\d+\.\s\s\w+:', line):
-                break
-            if re.match(r'^\d+\.\d+\s\w+:', line):
-                break
-            if line and line.startswith('|<---'):
+        Block parsing is fused into one loop: the dispatch already knows
+        the first token's kind, so each block consumes it directly
+        instead of re-examining it in a per-block helper.
+        """
+        children = []
+        add_block = children.append
+        tokens = self.tokens
+        total = len(tokens)
+        source = self._content
+        indent_size = self.INDENT_SIZE
+        pos = self.position
+
+        while pos < total:
+            token = tokens[pos]
+            kind = token[0]
+
+            if kind in (_MAIN_HDR, _SUB_HDR, _END_MARK):
                 break
-            if line == '':
-                self._consume_line()
-                continue
-
-            if line.lstrip().startswith('- '):
-                node = self._parse_unordered_list()
-                if node:
-                    children.append(node)
-                continue
-
-            if re.match(r'^\s*[A-Za-z0-9]+\.\s+', line):
-                node = self._parse_ordered_list()
-                if node:
-                    children.append(node)
+            if kind == _BLANK:
+                pos += 1
                 continue
 
-            para = self._parse_paragraph()
-            if para:
-                children.append(para)
-
+            start = pos + 1
+            if kind == _ULIST:
+                # Unordered list: consecutive '- ' item tokens
+                items = []
+                append = items.append
+                while True:
+                    pos += 1
+                    append(ASTNode(
+                        NodeType.LIST_ITEM,
+                        value=token[2].rstrip()[2:],
+                        level=token[1] // indent_size,
+                        line=pos + 1
+                    ))
+                    if pos >= total:
+                        break
+                    token = tokens[pos]
+                    if token[0] != _ULIST:
+                        break
+                add_block(ASTNode(
+                    NodeType.UNORDERED_LIST,
+                    children=items,
+                    line=start
+                ))
+            elif kind == _OLIST:
+                # Ordered list: consecutive 'N. content' item tokens
+                items = []
+                append = items.append
+                while True:
+                    pos += 1
+                    append(ASTNode(
+                        NodeType.LIST_ITEM,
+                        value=token[2][1],
+                        level=token[1] // indent_size,
+                        metadata={"number": token[2][0]},
+                        line=pos + 1
+                    ))
+                    if pos >= total:
+                        break
+                    token = tokens[pos]
+                    if token[0] != _OLIST:
+                        break
+                add_block(ASTNode(
+                    NodeType.ORDERED_LIST,
+                    children=items,
+                    line=start
+                ))
+            else:
+                # Paragraph: the first token is known text; scan the tail
+                first = pos
+                indent = token[1] // indent_size
+                pos += 1
+                while pos < total:
+                    token = tokens[pos]
+                    kind = token[0]
+                    if kind != _PARA:
+                        # An ordered-item-looking line only starts a
+                        # list at block level; inside a paragraph it is
+                        # continuation text unless it begins with a
+                        # column-0 'N.' prefix
+                        if kind != _OLIST:
+                            break
+                        if token[1] == 0:
+                            item = token[2][2]
+                            if item[0].isdigit():
+                                i = 1
+                                n = len(item)
+                                while i < n and item[i].isdigit():
+                                    i += 1
+                                if i < n and item[i] == '.':
+                                    break
+                    pos += 1
+
+                # One slice of the source covers every consumed line;
+                # at EOF, stop before any trailing newline so the value
+                # matches the joined lines it replaced
+                begin = tokens[first][3]
+                if pos < total:
+                    end = tokens[pos][3] - 1
+                elif source.endswith('\n'):
+                    end = len(source) - 1
+                else:
+                    end = len(source)
+                add_block(ASTNode(
+                    NodeType.PARAGRAPH,
+                    value=source[begin:end],
+                    level=indent,
+                    line=start
+                ))
+
+        self.position = pos
+        if not children:
+            return _EMPTY_BODY
         return ASTNode(NodeType.SECTION_BODY, children=children)
 
-    def _parse_paragraph(self) -> Optional[ASTNode]:
-        """Parse paragraph: consecutive non-blank, non-list lines."""
-        lines = []
-        start = self.current_line
-        indent = None
-
-        while self._peek_line() is not None:
-            line = self._peek_line()
-
-            if line == '':
-                break
-            if line.lstrip().startswith('- '):
-                break
-            if re.match(r'^\d+\.', line):
-                break
-
-            if indent is None:
-                indent = self._get_indent_level(line)
-
-            lines.append(self._consume_line())
-
-        if not lines:
-            return None
-
-        content = '\n'.join(lines)
-        return ASTNode(
-            NodeType.PARAGRAPH,
-            value=content,
-            level=indent,
-            line=start
-        )
-
-    def _parse_unordered_list(self) -> Optional[ASTNode]:
-        """Parse unordered list: consecutive lines starting with '- '."""
-        items = []
-        start = self.current_line
-
-        while self._peek_line() is not None:
-            line = self._peek_line()
-
-            if not line.lstrip().startswith('- '):
-                break
-
-            item_line = self._consume_line()
-            indent = self._get_indent_level(item_line)
-            content = item_line.strip()[2:]
-
-            items.append(ASTNode(
-                NodeType.LIST_ITEM,
-                value=content,
-                level=indent,
-                line=self.current_line
-            ))
-
-        if not items:
-            return None
-
-        return ASTNode(
-            NodeType.UNORDERED_LIST,
-            children=items,
-            line=start
-        )
-
-    def _parse_ordered_list(self) -> Optional[ASTNode]:
-        """Parse ordered list: lines matching pattern 'N. content'."""
-        items = []
-        start = self.current_line
-
-        while self._peek_line() is not None:
-            line = self._peek_line()
-
-            match = re.match(r'^(\s*)([A-Za-z0-9]+)\.\s+(.+)$', line)
-            if not match:
-                break
-
-            self._consume_line()
-            indent_str = match.group(1)
-            number = match.group(2)
-            content = match.group(3)
-            indent = len(indent_str) // self.INDENT_SIZE
-
-            items.append(ASTNode(
-                NodeType.LIST_ITEM,
-                value=content,
-                level=indent,
-                metadata={"number": number},
-                line=self.current_line
-            ))
-
-        if not items:
-            return None
-
-        return ASTNode(
-            NodeType.ORDERED_LIST,
-            children=items,
-            line=start
-        )
-
     def _parse_footer_notes(self) -> Optional[ASTNode]:
         """Parse optional footer notes between sections and end marker."""
-        start_pos = self.position
-
-        while self._peek_line() is not None:
-            line = self._peek_line()
-
-            if line and line.startswith('|<---'):
+        while True:
+            token = self._peek_token()
+            if token is None or token[0] == _END_MARK:
                 break
 
-            if line.strip():
-                footer_lines = []
-                footer_start = self.current_line
+            if _token_text(token).strip():
+                first = self.position
+                footer_start = first + 1
 
-                while self._peek_line() is not None:
-                    line = self._peek_line()
-                    if line and line.startswith('|<---'):
+                while True:
+                    token = self._peek_token()
+                    if token is None or token[0] == _END_MARK:
                         break
-                    footer_lines.append(self._consume_line())
-
-                while footer_lines and footer_lines[-1] == '':
-                    footer_lines.pop()
+                    self._consume_token()
 
-                if footer_lines:
-                    content = '\n'.join(footer_lines).strip()
+                content = self._slice_value(first, self.position)
+                if content:
                     return ASTNode(
                         NodeType.FOOTER_NOTES,
                         value=content,
@@ -439,6 +624,6 @@ class CRFCFParser:
                     )
                 break
 
-            self._consume_line()
+            self._consume_token()
 
         return None